@@ -24,7 +24,8 @@ async def lifespan(app: FastAPI):
     # Startup
     print("Starting Grok Intelligence Engine...")
     
-    # Connect to service registry
+    # Connect to service registry, advertising the same profiles as /capabilities
+    service_registry.set_available_profiles(await intelligence_engine.get_profile_ids())
     connected = await service_registry.connect()
     if connected:
         print("Connected to Jubal service registry")
@@ -86,7 +87,7 @@ async def get_capabilities():
             "global_overrides": True
         },
         "supported_providers": ["local", "openrouter"],
-        "available_profiles": ["business_meeting", "project_planning", "personal_notes"]
+        "available_profiles": await intelligence_engine.get_profile_ids()
     }
 
 
@@ -103,7 +104,8 @@ async def process_transcript(envelope: JubalEnvelope):
             )
 
         transcript = envelope.data.get("content", "")
-        if not transcript.strip():
+        # isspace() scans without allocating a stripped copy of the transcript
+        if not transcript or transcript.isspace():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Empty transcript content"
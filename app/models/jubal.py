@@ -1,6 +1,6 @@
 """Jubal service contract models."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
 
@@ -17,7 +17,7 @@ class JubalEnvelope(BaseModel):
 class JubalResponse(BaseModel):
     """Standard Jubal response format."""
     job_id: str = Field(..., description="Job identifier from request")
-    status: str = Field(..., pattern="^(completed|error|processing)$", description="Processing status")
+    status: Literal["completed", "error", "processing"] = Field(..., description="Processing status")
     data: Optional[Dict[str, Any]] = Field(None, description="Response data payload")
     error: Optional[Dict[str, Any]] = Field(default=None, description="Error information if status=error")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Response metadata")
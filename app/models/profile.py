@@ -1,11 +1,18 @@
 """Processing profile models for multi-step analysis."""
 
+from collections import deque
 from typing import List, Dict, Any, Optional, Union, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 import re
 import json
 
 
+# Compiled once at import; validators run for every step of every profile load
+_PLACEHOLDER_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+_INVALID_PLACEHOLDER_RE = re.compile(r'\{[^}]*[^a-zA-Z0-9_}][^}]*\}')
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
 class ModelConfig(BaseModel):
     """Configuration for LLM model requests."""
     provider: Literal["local", "openrouter"] = Field(default="local", description="LLM provider")
@@ -16,27 +23,6 @@ class ModelConfig(BaseModel):
     top_p: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="Top-p nucleus sampling")
     frequency_penalty: Optional[float] = Field(default=None, ge=-2.0, le=2.0, description="Frequency penalty")
     presence_penalty: Optional[float] = Field(default=None, ge=-2.0, le=2.0, description="Presence penalty")
-    
-    @field_validator('model')
-    @classmethod
-    def validate_model_for_provider(cls, v, info):
-        """Validate model compatibility with provider."""
-        provider = info.data.get('provider', 'local')
-        
-        # Common model patterns for validation
-        local_models = ['llama3.1:8b', 'mistral:7b', 'codellama:7b', 'phi3:mini']
-        openrouter_patterns = [
-            'openai/', 'anthropic/', 'google/', 'meta-llama/', 'microsoft/', 'mistralai/'
-        ]
-        
-        if provider == "local" and v not in local_models and not any(v.startswith(p) for p in ['llama', 'mistral', 'phi', 'codellama']):
-            # Allow flexibility for local models but warn about common patterns
-            pass
-        elif provider == "openrouter" and not any(v.startswith(p) for p in openrouter_patterns):
-            # OpenRouter models should follow provider/model pattern
-            pass
-            
-        return v
 
 
 class StepOutputSchema(BaseModel):
@@ -70,13 +56,8 @@ class ProcessingStep(BaseModel):
         if '{transcript}' not in v:
             raise ValueError("Prompt template must include {transcript} placeholder")
         
-        # Validate placeholder syntax using regex
-        placeholder_pattern = r'\{[a-zA-Z_][a-zA-Z0-9_]*\}'
-        placeholders = re.findall(placeholder_pattern, v)
-        
         # Check for invalid placeholder syntax
-        invalid_pattern = r'\{[^}]*[^a-zA-Z0-9_}][^}]*\}'
-        invalid_placeholders = re.findall(invalid_pattern, v)
+        invalid_placeholders = _INVALID_PLACEHOLDER_RE.findall(v)
         if invalid_placeholders:
             raise ValueError(f"Invalid placeholder syntax: {invalid_placeholders}")
         
@@ -87,14 +68,13 @@ class ProcessingStep(BaseModel):
     def validate_dependencies(cls, v):
         """Validate dependency step IDs."""
         for dep in v:
-            if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', dep):
+            if not _IDENTIFIER_RE.match(dep):
                 raise ValueError(f"Invalid dependency step ID: {dep}")
         return v
     
     def get_placeholder_variables(self) -> List[str]:
         """Extract all placeholder variables from prompt template."""
-        placeholder_pattern = r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}'
-        return re.findall(placeholder_pattern, self.prompt_template)
+        return _PLACEHOLDER_RE.findall(self.prompt_template)
 
 
 class ProfileMetadata(BaseModel):
@@ -119,6 +99,12 @@ class ProcessingProfile(BaseModel):
     estimated_tokens: int = Field(default=1000, ge=100, le=50000, description="Estimated token usage")
     metadata: ProfileMetadata = Field(default_factory=ProfileMetadata, description="Profile metadata")
     
+    # Derived from steps at validation time (profiles are treated as immutable once loaded).
+    # Filled eagerly so equal profiles always carry equal private state.
+    _steps_by_id: Dict[str, ProcessingStep] = PrivateAttr(default_factory=dict)
+    _execution_order: List[str] = PrivateAttr(default_factory=list)
+    _interpolation_issues: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    
     @field_validator('steps')
     @classmethod
     def validate_steps_unique_ids(cls, v):
@@ -171,41 +157,57 @@ class ProcessingProfile(BaseModel):
         
         return self
     
+    @model_validator(mode='after')
+    def derive_step_data(self):
+        """Precompute step lookups, execution order and interpolation issues."""
+        self._steps_by_id = {step.step_id: step for step in self.steps}
+        self._execution_order = self._resolve_execution_order()
+        self._interpolation_issues = self._find_interpolation_issues()
+        return self
+    
     def get_execution_order(self) -> List[str]:
         """Get steps in dependency-resolved execution order."""
+        return list(self._execution_order)
+    
+    def _resolve_execution_order(self) -> List[str]:
+        """Topologically sort steps by their dependencies."""
         # Topological sort
         in_degree = {step.step_id: len(step.dependencies) for step in self.steps}
-        queue = [step_id for step_id, degree in in_degree.items() if degree == 0]
+        dependents: Dict[str, List[str]] = {step.step_id: [] for step in self.steps}
+        for step in self.steps:
+            for dep in step.dependencies:
+                dependents[dep].append(step.step_id)
+        
+        queue = deque(step_id for step_id, degree in in_degree.items() if degree == 0)
         result = []
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
             
             # Update in-degrees for dependent steps
-            for step in self.steps:
-                if current in step.dependencies:
-                    in_degree[step.step_id] -= 1
-                    if in_degree[step.step_id] == 0:
-                        queue.append(step.step_id)
+            for step_id in dependents[current]:
+                in_degree[step_id] -= 1
+                if in_degree[step_id] == 0:
+                    queue.append(step_id)
         
         return result
     
     def get_step(self, step_id: str) -> Optional[ProcessingStep]:
         """Get step by ID."""
-        for step in self.steps:
-            if step.step_id == step_id:
-                return step
-        return None
+        return self._steps_by_id.get(step_id)
     
     def validate_interpolation_variables(self) -> Dict[str, List[str]]:
         """Validate that all interpolation variables are available."""
+        return {step_id: list(missing) for step_id, missing in self._interpolation_issues.items()}
+    
+    def _find_interpolation_issues(self) -> Dict[str, List[str]]:
+        """Walk steps in execution order and collect unavailable variables."""
         available_vars = {'transcript'}  # Always available
-        step_outputs = {}  # Track what each step provides
         issues = {}
         
-        for step_id in self.get_execution_order():
-            step = self.get_step(step_id)
+        for step_id in self._execution_order:
+            step = self._steps_by_id.get(step_id)
             if not step:
                 continue
                 
@@ -220,6 +222,5 @@ class ProcessingProfile(BaseModel):
             # Add this step's output to available variables if it passes to next
             if step.pass_to_next:
                 available_vars.add(step.step_id)
-                step_outputs[step.step_id] = step.output_format
         
         return issues
\ No newline at end of file
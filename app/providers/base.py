@@ -78,18 +78,20 @@ class LLMProvider(ABC):
 
     def _log_request(self, model: str, prompt_length: int, **kwargs):
         """Log outgoing request for debugging."""
+        # Lazy %-style args: nothing is formatted unless DEBUG is enabled
         self.logger.debug(
-            f"Request to {self.name}: model={model}, prompt_length={prompt_length}, "
-            f"temperature={kwargs.get('temperature', 'default')}, "
-            f"max_tokens={kwargs.get('max_tokens', 'default')}"
+            "Request to %s: model=%s, prompt_length=%s, temperature=%s, max_tokens=%s",
+            self.name, model, prompt_length,
+            kwargs.get('temperature', 'default'),
+            kwargs.get('max_tokens', 'default')
         )
 
     def _log_response(self, response: LLMResponse):
         """Log response for debugging and monitoring."""
         self.logger.debug(
-            f"Response from {self.name}: tokens={response.tokens_used}, "
-            f"time={response.processing_time_ms}ms, "
-            f"content_length={len(response.content)}"
+            "Response from %s: tokens=%s, time=%sms, content_length=%s",
+            self.name, response.tokens_used,
+            response.processing_time_ms, len(response.content)
         )
 
     def _log_error(self, error: Exception, context: str = ""):
@@ -164,12 +164,7 @@ class OllamaProvider(LLMProvider):
                     )
 
                 data = await response.json()
-                models = []
-                
-                for model_info in data.get("models", []):
-                    model_name = model_info.get("name", "")
-                    if model_name:
-                        models.append(model_name)
+                models = self._parse_model_names(data)
 
                 self.logger.info(f"Found {len(models)} Ollama models: {models}")
                 return models
@@ -192,6 +187,15 @@ class OllamaProvider(LLMProvider):
             self._log_error(error, "list_models")
             raise error
 
+    @staticmethod
+    def _parse_model_names(data: Dict[str, Any]) -> List[str]:
+        """Extract model names from an /api/tags response body."""
+        return [
+            model_name
+            for model_info in data.get("models", [])
+            if (model_name := model_info.get("name", ""))
+        ]
+
     async def check_health(self) -> ProviderHealth:
         """Check if Ollama instance is available and responsive."""
         start_time = time.time()
@@ -208,9 +212,9 @@ class OllamaProvider(LLMProvider):
                 response_time_ms = int((time.time() - start_time) * 1000)
                 
                 if response.status == 200:
-                    # Try to get available models
+                    # Models come from the same /api/tags response
                     try:
-                        models = await self.list_available_models()
+                        models = self._parse_model_names(await response.json())
                         return ProviderHealth(
                             available=True,
                             response_time_ms=response_time_ms,
@@ -29,6 +29,9 @@ class OpenRouterProvider(LLMProvider):
         "cohere/command-r-plus": {"description": "Command R+", "context": 128000},
     }
 
+    # Optional request parameters passed through to the API when supplied
+    OPTIONAL_PARAMS = ("stop", "top_p", "frequency_penalty", "presence_penalty")
+
     def __init__(
         self, 
         api_key: str,
@@ -106,14 +109,9 @@ class OpenRouterProvider(LLMProvider):
             }
 
             # Add optional parameters
-            if "stop" in kwargs:
-                payload["stop"] = kwargs["stop"]
-            if "top_p" in kwargs:
-                payload["top_p"] = kwargs["top_p"]
-            if "frequency_penalty" in kwargs:
-                payload["frequency_penalty"] = kwargs["frequency_penalty"]
-            if "presence_penalty" in kwargs:
-                payload["presence_penalty"] = kwargs["presence_penalty"]
+            for param in self.OPTIONAL_PARAMS:
+                if param in kwargs:
+                    payload[param] = kwargs[param]
 
             async with session.post(
                 f"{self.base_url}/chat/completions",
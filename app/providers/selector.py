@@ -2,13 +2,17 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from app.models.profile import ModelConfig
 from .base import LLMProvider, LLMProviderError, LLMResponse
 
 
 logger = logging.getLogger(__name__)
 
+# How long a provider availability check is reused before checking again
+AVAILABILITY_TTL_SECONDS = 10.0
+
 
 class ModelSelector:
     """Intelligent model selection with fallback strategies."""
@@ -17,6 +21,26 @@ class ModelSelector:
         self.providers = providers
         self.fallback_order = ["local", "openrouter"]  # Default fallback order
         self.logger = logging.getLogger(__name__)
+        
+        # Provider name -> (monotonic check time, available)
+        self._availability: Dict[str, Tuple[float, bool]] = {}
+
+    async def _is_available(self, name: str, provider: LLMProvider) -> bool:
+        """Check provider availability, reusing a recent result."""
+        now = time.monotonic()
+        cached = self._availability.get(name)
+        if cached is not None and now - cached[0] < AVAILABILITY_TTL_SECONDS:
+            return cached[1]
+        
+        available = await provider.is_available()
+        self._availability[name] = (now, available)
+        return available
+
+    def invalidate_availability(self, provider: LLMProvider) -> None:
+        """Forget the cached availability of a provider that just failed."""
+        for name, configured in self.providers.items():
+            if configured is provider:
+                self._availability.pop(name, None)
 
     async def select_provider(
         self, 
@@ -37,7 +61,7 @@ class ModelSelector:
         preferred_provider = self.providers.get(effective_config.provider)
         if preferred_provider:
             try:
-                is_available = await preferred_provider.is_available()
+                is_available = await self._is_available(effective_config.provider, preferred_provider)
                 if is_available:
                     self.logger.info(f"Using preferred provider: {effective_config.provider}")
                     return preferred_provider
@@ -58,13 +82,11 @@ class ModelSelector:
             fallback_provider = self.providers.get(provider_name)
             if fallback_provider:
                 try:
-                    is_available = await fallback_provider.is_available()
+                    is_available = await self._is_available(provider_name, fallback_provider)
                     if is_available:
                         self.logger.warning(
                             f"Falling back from {effective_config.provider} to {provider_name}"
                         )
-                        # Update config to reflect the fallback
-                        effective_config.provider = provider_name
                         return fallback_provider
                 except Exception as e:
                     self.logger.warning(
@@ -121,15 +143,28 @@ class ModelSelector:
             self.logger.error(
                 f"Completion failed with provider {provider.name}: {e}"
             )
+            self.invalidate_availability(provider)
             raise
 
     async def get_provider_status(self) -> Dict[str, Dict[str, Any]]:
         """Get health status of all configured providers."""
         status = {}
         
-        for name, provider in self.providers.items():
-            try:
-                health = await provider.check_health()
+        # Health checks are independent network calls; run them concurrently
+        names = list(self.providers)
+        results = await asyncio.gather(
+            *(self.providers[name].check_health() for name in names),
+            return_exceptions=True
+        )
+        
+        for name, health in zip(names, results):
+            if isinstance(health, BaseException):
+                status[name] = {
+                    "available": False,
+                    "error": f"Health check failed: {health}"
+                }
+            else:
+                self._availability[name] = (time.monotonic(), health.available)
                 status[name] = {
                     "available": health.available,
                     "response_time_ms": health.response_time_ms,
@@ -137,12 +172,7 @@ class ModelSelector:
                     "models": health.models_available[:5],  # Limit for response size
                     "error": health.error_message
                 }
-            except Exception as e:
-                status[name] = {
-                    "available": False,
-                    "error": f"Health check failed: {e}"
-                }
-        
+
         return status
 
     async def close_all(self):
@@ -1,8 +1,10 @@
 """Step execution engine for multi-step profile processing."""
 
 import asyncio
+import random
 import time
 import logging
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 
@@ -14,65 +16,66 @@ from .interpolation import StepContext, OutputValidator, InterpolationError
 
 logger = logging.getLogger(__name__)
 
+# Retry backoff: exponential with full jitter so concurrent steps don't retry in lockstep
+RETRY_BACKOFF_BASE_SECONDS = 0.5
+RETRY_BACKOFF_MAX_SECONDS = 4.0
+
+# Global override keys that replace a model config field directly
+DIRECT_CONFIG_OVERRIDES = {
+    "force_provider": "provider",
+    "force_model": "model",
+}
+
 
 class ExecutionError(Exception):
     """Error during step execution."""
     pass
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
 class StepResult:
     """Result of a single step execution."""
-    
-    def __init__(
-        self,
-        step_id: str,
-        success: bool,
-        output: Any = None,
-        error: Optional[str] = None,
-        execution_time_ms: int = 0,
-        tokens_used: int = 0,
-        model_used: Optional[str] = None,
-        provider_used: Optional[str] = None,
-        retry_count: int = 0
-    ):
-        self.step_id = step_id
-        self.success = success
-        self.output = output
-        self.error = error
-        self.execution_time_ms = execution_time_ms
-        self.tokens_used = tokens_used
-        self.model_used = model_used
-        self.provider_used = provider_used
-        self.retry_count = retry_count
-        self.timestamp = datetime.now(timezone.utc)
+    step_id: str
+    success: bool
+    output: Any = None
+    error: Optional[str] = None
+    execution_time_ms: int = 0
+    tokens_used: int = 0
+    model_used: Optional[str] = None
+    provider_used: Optional[str] = None
+    retry_count: int = 0
+    timestamp: datetime = field(init=False, default_factory=_utc_now)
 
 
+@dataclass(slots=True)
 class ProfileResult:
     """Result of complete profile execution."""
+    profile_id: str
+    success: bool
+    step_results: List[StepResult]
+    final_output: Dict[str, Any]
+    total_execution_time_ms: int
+    total_tokens_used: int
+    error: Optional[str] = None
+    timestamp: datetime = field(init=False, default_factory=_utc_now)
+    successful_steps: int = field(init=False)
+    failed_steps: int = field(init=False)
+    total_retries: int = field(init=False)
     
-    def __init__(
-        self,
-        profile_id: str,
-        success: bool,
-        step_results: List[StepResult],
-        final_output: Dict[str, Any],
-        total_execution_time_ms: int,
-        total_tokens_used: int,
-        error: Optional[str] = None
-    ):
-        self.profile_id = profile_id
-        self.success = success
-        self.step_results = step_results
-        self.final_output = final_output
-        self.total_execution_time_ms = total_execution_time_ms
-        self.total_tokens_used = total_tokens_used
-        self.error = error
-        self.timestamp = datetime.now(timezone.utc)
-        
-        # Compute summary stats
-        self.successful_steps = sum(1 for r in step_results if r.success)
-        self.failed_steps = sum(1 for r in step_results if not r.success)
-        self.total_retries = sum(r.retry_count for r in step_results)
+    def __post_init__(self):
+        # Compute summary stats in a single pass
+        successful_steps = 0
+        total_retries = 0
+        for r in self.step_results:
+            successful_steps += r.success
+            total_retries += r.retry_count
+        self.successful_steps = successful_steps
+        self.failed_steps = len(self.step_results) - successful_steps
+        self.total_retries = total_retries
 
 
 class StepExecutor:
@@ -103,7 +106,7 @@ class StepExecutor:
         retry_count = 0
         last_error = None
         
-        self.logger.info(f"Executing step: {step.step_id}")
+        self.logger.info("Executing step: %s", step.step_id)
         
         # Validate variables are available
         missing_vars = context.validate_step_variables(
@@ -130,8 +133,8 @@ class StepExecutor:
                 result.retry_count = retry_count
                 
                 self.logger.info(
-                    f"Step {step.step_id} completed successfully "
-                    f"(attempt {retry_count + 1}, {execution_time}ms, {result.tokens_used} tokens)"
+                    "Step %s completed successfully (attempt %d, %dms, %d tokens)",
+                    step.step_id, retry_count + 1, execution_time, result.tokens_used
                 )
                 
                 return result
@@ -141,12 +144,16 @@ class StepExecutor:
                 retry_count += 1
                 
                 self.logger.warning(
-                    f"Step {step.step_id} failed (attempt {retry_count}): {last_error}"
+                    "Step %s failed (attempt %d): %s", step.step_id, retry_count, last_error
                 )
                 
                 if retry_count <= step.max_retries and step.retry_on_failure:
-                    # Brief delay before retry
-                    await asyncio.sleep(0.5 * retry_count)
+                    # Jittered exponential delay before retry
+                    backoff = min(
+                        RETRY_BACKOFF_MAX_SECONDS,
+                        RETRY_BACKOFF_BASE_SECONDS * (2 ** (retry_count - 1))
+                    )
+                    await asyncio.sleep(random.uniform(0, backoff))
                 else:
                     break
         
@@ -154,7 +161,7 @@ class StepExecutor:
         execution_time = int((time.time() - start_time) * 1000)
         error_msg = f"Step failed after {retry_count} attempts: {last_error}"
         
-        self.logger.error(f"Step {step.step_id} failed permanently: {error_msg}")
+        self.logger.error("Step %s failed permanently: %s", step.step_id, error_msg)
         
         return StepResult(
             step_id=step.step_id,
@@ -188,8 +195,14 @@ class StepExecutor:
         # 3. Select and execute with LLM provider
         try:
             provider = await self.model_selector.select_provider(model_config, global_overrides)
+        except Exception as e:
+            raise ExecutionError(f"LLM generation failed: {e}")
+        
+        try:
             llm_response = await provider.generate_completion(prompt, model_config)
         except Exception as e:
+            # Re-check this provider on the next attempt so a retry can fall back
+            self.model_selector.invalidate_availability(provider)
             raise ExecutionError(f"LLM generation failed: {e}")
         
         # 4. Validate and process output
@@ -247,12 +260,9 @@ class StepExecutor:
                 actual_key = key.replace("global_", "")
                 if actual_key in config_dict:
                     config_dict[actual_key] = value
-            elif key in ["force_provider", "force_model"]:
+            elif key in DIRECT_CONFIG_OVERRIDES:
                 # Direct provider/model overrides
-                if key == "force_provider":
-                    config_dict["provider"] = value
-                elif key == "force_model":
-                    config_dict["model"] = value
+                config_dict[DIRECT_CONFIG_OVERRIDES[key]] = value
         
         # Apply step-specific overrides
         step_overrides = global_overrides.get("step_overrides", {}).get(step_id, {})
@@ -288,7 +298,7 @@ class ProfileExecutor:
             ProfileResult with complete execution details
         """
         start_time = time.time()
-        self.logger.info(f"Starting profile execution: {profile.profile_id}")
+        self.logger.info("Starting profile execution: %s", profile.profile_id)
         
         # Initialize execution context
         context = StepContext(transcript)
@@ -310,24 +320,16 @@ class ProfileExecutor:
                     error=error_msg
                 )
             
-            # Execute steps in dependency order
-            execution_order = profile.get_execution_order()
-            
-            for step_id in execution_order:
-                step = profile.get_step(step_id)
-                if not step:
-                    continue
+            # Execute steps in dependency order, running independent steps concurrently
+            for wave in self._build_execution_waves(profile):
+                wave_results, failed = await self._execute_wave(wave, context, global_overrides)
+                step_results.extend(wave_results)
+                total_tokens += sum(r.tokens_used for r in wave_results)
                 
-                # Execute step
-                step_result = await self.step_executor.execute_step(
-                    step, context, global_overrides
-                )
-                step_results.append(step_result)
-                total_tokens += step_result.tokens_used
-                
-                # Check if step was required and failed
-                if step.required and not step_result.success:
-                    error_msg = f"Required step '{step_id}' failed: {step_result.error}"
+                # Check if a required step failed
+                if failed is not None:
+                    step, step_result = failed
+                    error_msg = f"Required step '{step.step_id}' failed: {step_result.error}"
                     self.logger.error(error_msg)
                     
                     return ProfileResult(
@@ -345,8 +347,8 @@ class ProfileExecutor:
             execution_time = int((time.time() - start_time) * 1000)
             
             self.logger.info(
-                f"Profile {profile.profile_id} completed successfully "
-                f"({execution_time}ms, {total_tokens} tokens, {len(step_results)} steps)"
+                "Profile %s completed successfully (%dms, %d tokens, %d steps)",
+                profile.profile_id, execution_time, total_tokens, len(step_results)
             )
             
             return ProfileResult(
@@ -372,6 +374,72 @@ class ProfileExecutor:
                 error=error_msg
             )
     
+    async def _execute_wave(
+        self,
+        wave: List[ProcessingStep],
+        context: StepContext,
+        global_overrides: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[StepResult], Optional[Tuple[ProcessingStep, StepResult]]]:
+        """
+        Execute one wave of steps concurrently.
+        
+        As soon as a required step fails, the steps still running in the wave
+        are cancelled. Returns the results of finished steps in wave order and
+        the failed required step with its result, if any.
+        """
+        tasks = {
+            asyncio.create_task(self.step_executor.execute_step(step, context, global_overrides)): step
+            for step in wave
+        }
+        results: Dict[str, StepResult] = {}
+        failed: Optional[Tuple[ProcessingStep, StepResult]] = None
+        pending = set(tasks)
+        
+        try:
+            while pending and failed is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[tasks[task].step_id] = task.result()
+                
+                for step in wave:
+                    step_result = results.get(step.step_id)
+                    if step_result is not None and step.required and not step_result.success:
+                        failed = (step, step_result)
+                        break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        return [results[step.step_id] for step in wave if step.step_id in results], failed
+    
+    def _build_execution_waves(self, profile: ProcessingProfile) -> List[List[ProcessingStep]]:
+        """
+        Group steps into waves that can run concurrently.
+        
+        A step is placed in the first wave after every step it depends on,
+        including steps it only references through a prompt placeholder.
+        """
+        step_ids = {step.step_id for step in profile.steps}
+        levels: Dict[str, int] = {}
+        waves: List[List[ProcessingStep]] = []
+        
+        for step_id in profile.get_execution_order():
+            step = profile.get_step(step_id)
+            if not step:
+                continue
+            
+            needs = set(step.dependencies) | (set(step.get_placeholder_variables()) & step_ids)
+            level = max((levels[n] + 1 for n in needs if n in levels), default=0)
+            levels[step_id] = level
+            
+            if level == len(waves):
+                waves.append([])
+            waves[level].append(step)
+        
+        return waves
+    
     def _compile_final_output(
         self,
         step_results: List[StepResult],
@@ -380,33 +448,39 @@ class ProfileExecutor:
         """Compile final output from all step results."""
         
         final_output = {}
+        step_summary = []
+        steps_completed = 0
+        total_tokens = 0
+        total_execution_time_ms = 0
         
-        # Include all successful step outputs
-        for result in step_results:
-            if result.success and result.output is not None:
-                final_output[result.step_id] = result.output
+        # Collect successful step outputs and per-step stats in one pass
+        for r in step_results:
+            if r.success:
+                steps_completed += 1
+                if r.output is not None:
+                    final_output[r.step_id] = r.output
+            total_tokens += r.tokens_used
+            total_execution_time_ms += r.execution_time_ms
+            step_summary.append({
+                "step_id": r.step_id,
+                "success": r.success,
+                "execution_time_ms": r.execution_time_ms,
+                "tokens_used": r.tokens_used,
+                "model_used": r.model_used,
+                "provider_used": r.provider_used,
+                "retry_count": r.retry_count
+            })
         
         # Add execution metadata
         final_output["_metadata"] = {
             "profile_id": profile.profile_id,
             "profile_name": profile.name,
             "profile_version": profile.version,
-            "steps_completed": len([r for r in step_results if r.success]),
-            "steps_failed": len([r for r in step_results if not r.success]),
-            "total_tokens": sum(r.tokens_used for r in step_results),
-            "total_execution_time_ms": sum(r.execution_time_ms for r in step_results),
-            "step_summary": [
-                {
-                    "step_id": r.step_id,
-                    "success": r.success,
-                    "execution_time_ms": r.execution_time_ms,
-                    "tokens_used": r.tokens_used,
-                    "model_used": r.model_used,
-                    "provider_used": r.provider_used,
-                    "retry_count": r.retry_count
-                }
-                for r in step_results
-            ]
+            "steps_completed": steps_completed,
+            "steps_failed": len(step_results) - steps_completed,
+            "total_tokens": total_tokens,
+            "total_execution_time_ms": total_execution_time_ms,
+            "step_summary": step_summary
         }
         
         return final_output
\ No newline at end of file
@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-import time
 import logging
 from typing import Dict, Any, Optional, List
 from app.models.profile import ProcessingProfile, ProcessingStep, ModelConfig
@@ -62,12 +61,18 @@ class IntelligenceEngine:
 
     async def get_available_profiles(self) -> Dict[str, Any]:
         """Get list of available processing profiles."""
-        profiles = self.profile_manager.list_available_profiles()
+        # Directory scan and JSON reads are blocking; keep them off the event loop
+        profiles = await asyncio.to_thread(self.profile_manager.list_available_profiles)
         return {"profiles": profiles}
 
+    async def get_profile_ids(self) -> List[str]:
+        """Get IDs of available processing profiles."""
+        # Directory scan is blocking; keep it off the event loop
+        return await asyncio.to_thread(self.profile_manager.list_profile_ids)
+
     async def get_profile_details(self, profile_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific profile."""
-        profile_details = self.profile_manager.get_profile_details(profile_id)
+        profile_details = await asyncio.to_thread(self.profile_manager.get_profile_details, profile_id)
         if not profile_details:
             raise ValueError(f"Profile {profile_id} not found")
         
@@ -96,12 +101,10 @@ class IntelligenceEngine:
     ) -> Dict[str, Any]:
         """Process transcript with specified profile."""
         
-        # Load the profile
-        profile = self.profile_manager.load_profile(profile_id)
+        # Load the profile (may read and validate a profile file, so keep it off the event loop)
+        profile = await asyncio.to_thread(self.profile_manager.load_profile, profile_id)
         if not profile:
             raise ValueError(f"Profile {profile_id} not found")
-
-        start_time = time.time()
         
         # Check if LLM processing is available
         if not self.profile_executor:
@@ -178,9 +181,6 @@ class IntelligenceEngine:
     ) -> Dict[str, Any]:
         """Fallback placeholder processing when LLM is unavailable."""
         
-        # Simulate processing delay
-        await asyncio.sleep(0.1)
-        
         return {
             "entities": {
                 "people": ["[Placeholder]", "[Analysis]"],
@@ -6,6 +6,11 @@ from typing import Dict, Any, List, Optional, Union
 from string import Template
 
 
+# Compiled once at import; interpolation runs for every step attempt
+_PLACEHOLDER_RE = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+_TEMPLATE_VAR_RE = re.compile(r'\$([a-zA-Z_][a-zA-Z0-9_]*)')
+
+
 class InterpolationError(Exception):
     """Error during variable interpolation."""
     pass
@@ -15,7 +20,7 @@ class VariableInterpolator:
     """Handles variable interpolation in prompt templates."""
     
     def __init__(self):
-        self.placeholder_pattern = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+        self.placeholder_pattern = _PLACEHOLDER_RE
     
     def extract_variables(self, template: str) -> List[str]:
         """Extract all variable names from template."""
@@ -34,16 +39,9 @@ class VariableInterpolator:
                     if brace_count < 0:
                         return False
             
-            if brace_count != 0:
-                return False
-            
-            # Check for valid variable names
-            variables = self.extract_variables(template)
-            for var in variables:
-                if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', var):
-                    return False
-            
-            return True
+            # Extracted variable names always match the placeholder pattern,
+            # so balanced braces are the only remaining check
+            return brace_count == 0
         except Exception:
             return False
     
@@ -102,7 +100,7 @@ class VariableInterpolator:
         # Perform interpolation using string.Template for safety
         try:
             # Convert {var} to $var format for Template
-            template_str = re.sub(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}', r'$\1', template)
+            template_str = self.placeholder_pattern.sub(r'$\1', template)
             template_obj = Template(template_str)
             
             # Interpolate with safe substitution
@@ -111,7 +109,7 @@ class VariableInterpolator:
             else:
                 result = template_obj.safe_substitute(safe_variables)
                 # Convert back any remaining $var to {var}
-                result = re.sub(r'\$([a-zA-Z_][a-zA-Z0-9_]*)', r'{\1}', result)
+                result = _TEMPLATE_VAR_RE.sub(r'{\1}', result)
             
             return result
             
@@ -128,6 +126,9 @@ class StepContext:
         self.variables: Dict[str, Any] = {"transcript": transcript}
         self.step_outputs: Dict[str, Any] = {}
         self.interpolator = VariableInterpolator()
+        
+        # JSON text of structured step outputs, rendered once and reused by later prompts
+        self._rendered_outputs: Dict[str, str] = {}
     
     def add_step_output(self, step_id: str, output: Any, pass_to_next: bool = True):
         """Add output from completed step."""
@@ -146,12 +147,11 @@ class StepContext:
             if dep_step_id in self.step_outputs:
                 available_vars[dep_step_id] = self.step_outputs[dep_step_id]
         
-        # Add any other global variables that were passed to next
+        # Add any other step outputs that were passed to next; every entry in
+        # self.variables besides the transcript comes from add_step_output()
         for var_name, value in self.variables.items():
-            if var_name != "transcript" and var_name not in dependencies:
-                # Only include if it's a step output that was passed to next
-                if var_name in self.step_outputs:
-                    available_vars[var_name] = value
+            if var_name not in available_vars:
+                available_vars[var_name] = value
         
         return available_vars
     
@@ -164,6 +164,17 @@ class StepContext:
     ) -> str:
         """Interpolate prompt template for specific step."""
         variables = self.get_variables_for_step(step_id, dependencies)
+        
+        # Only outputs this template references need rendering
+        for var_name in self.interpolator.extract_variables(template):
+            value = variables.get(var_name)
+            if isinstance(value, (dict, list)):
+                rendered = self._rendered_outputs.get(var_name)
+                if rendered is None:
+                    rendered = json.dumps(value, indent=2)
+                    self._rendered_outputs[var_name] = rendered
+                variables[var_name] = rendered
+        
         return self.interpolator.interpolate(template, variables, strict)
     
     def validate_step_variables(
@@ -2,8 +2,9 @@
 
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 import logging
 
@@ -13,6 +14,15 @@ from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Same shape as ProcessingProfile.profile_id; anything else can't name a profile file
+# (used with fullmatch, which unlike '$' also rejects a trailing newline)
+_PROFILE_ID_RE = re.compile(r'[a-z0-9_]+')
+
+
+def _is_valid_profile_id(profile_id: Any) -> bool:
+    """Check that a value can name a profile (ids arrive untyped from request metadata)."""
+    return isinstance(profile_id, str) and _PROFILE_ID_RE.fullmatch(profile_id) is not None
+
 
 class ProfileLoadError(Exception):
     """Error loading or parsing profile."""
@@ -310,6 +320,11 @@ Format your response as valid JSON only.""",
             ProcessingProfile if found, None otherwise
         """
         
+        # Reject malformed ids before they reach the cache or the filesystem
+        if not _is_valid_profile_id(profile_id):
+            self.logger.warning(f"Invalid profile id: {profile_id!r}")
+            return None
+        
         # Check cache first (unless force reload)
         if not force_reload and profile_id in self._profile_cache:
             return self._profile_cache[profile_id]
@@ -362,18 +377,21 @@ Format your response as valid JSON only.""",
             True if saved successfully
         """
         profile_file = self.profiles_dir / f"{profile.profile_id}.json"
-        
-        if profile_file.exists() and not overwrite:
-            raise ProfileLoadError(f"Profile file already exists: {profile_file}")
+        created = False
         
         try:
-            # Update metadata
-            profile.metadata.updated_at = datetime.now(timezone.utc).isoformat()
-            profile.metadata.source = "user"
-            
-            # Save to file
-            with open(profile_file, 'w', encoding='utf-8') as f:
-                json.dump(profile.model_dump(), f, indent=2, ensure_ascii=False)
+            # Exclusive create ('x') makes the existence check part of the open itself
+            with open(profile_file, 'w' if overwrite else 'x', encoding='utf-8') as f:
+                created = not overwrite
+                
+                # Update metadata
+                profile.metadata.updated_at = datetime.now(timezone.utc).isoformat()
+                profile.metadata.source = "user"
+                
+                # Save to file
+                # Unset optional fields load back as None, so leave them out
+                f.write(profile.model_dump_json(indent=2, exclude_none=True))
+            created = False
             
             # Update cache
             self._profile_cache[profile.profile_id] = profile
@@ -382,7 +400,12 @@ Format your response as valid JSON only.""",
             self.logger.info(f"Saved profile to file: {profile.profile_id}")
             return True
             
+        except FileExistsError:
+            raise ProfileLoadError(f"Profile file already exists: {profile_file}") from None
         except Exception as e:
+            if created:
+                # Don't leave a partial file behind to block the next save
+                profile_file.unlink(missing_ok=True)
             self.logger.error(f"Failed to save profile {profile.profile_id}: {e}")
             return False
     
@@ -395,15 +418,15 @@ Format your response as valid JSON only.""",
         """
         profiles = []
         
-        # Add cached profiles
-        for profile in self._profile_cache.values():
+        # Add cached profiles (snapshot, as this may run in a worker thread)
+        for profile in list(self._profile_cache.values()):
             profiles.append({
                 "profile_id": profile.profile_id,
                 "name": profile.name,
                 "description": profile.description,
                 "version": profile.version,
                 "steps": len(profile.steps),
-                "tags": profile.tags,
+                "tags": list(profile.tags),
                 "estimated_tokens": profile.estimated_tokens,
                 "source": profile.metadata.source,
                 "created_at": profile.metadata.created_at,
@@ -411,9 +434,7 @@ Format your response as valid JSON only.""",
             })
         
         # Scan for additional profile files
-        for profile_file in self.profiles_dir.glob("*.json"):
-            profile_id = profile_file.stem
-            
+        for profile_id, profile_file in self._profile_files():
             if profile_id not in self._profile_cache:
                 # Try to load basic info without full validation
                 try:
@@ -438,7 +459,27 @@ Format your response as valid JSON only.""",
                     self.logger.warning(f"Could not read profile metadata for {profile_file}: {e}")
         
         return sorted(profiles, key=lambda x: x["profile_id"])
-    
+
+    def list_profile_ids(self) -> List[str]:
+        """
+        List IDs of all available profiles without reading profile files.
+
+        File names that are not valid profile IDs are skipped, since
+        load_profile would reject them.
+
+        Returns:
+            Sorted list of profile IDs
+        """
+        profile_ids = set(self._profile_cache)
+        profile_ids.update(profile_id for profile_id, _ in self._profile_files())
+        return sorted(profile_ids)
+
+    def _profile_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (profile_id, path) for profile files that load_profile accepts."""
+        for profile_file in self.profiles_dir.glob("*.json"):
+            if _is_valid_profile_id(profile_file.stem):
+                yield profile_file.stem, profile_file
+
     def get_profile_details(self, profile_id: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific profile.
@@ -502,6 +543,7 @@ Format your response as valid JSON only.""",
             if profile_id in self._last_loaded:
                 del self._last_loaded[profile_id]
             
+            
             # Remove file if it exists
             if profile_file.exists():
                 profile_file.unlink()
@@ -2,7 +2,7 @@
 
 import json
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import redis.asyncio as redis
 from app.config import settings
 
@@ -30,6 +30,10 @@ class ServiceRegistry:
             "available_profiles": ["business_meeting", "project_planning", "personal_notes"]
         }
 
+    def set_available_profiles(self, profile_ids: List[str]):
+        """Set the profile IDs advertised on the next registration."""
+        self.service_info["available_profiles"] = list(profile_ids)
+
     async def connect(self):
         """Connect to Redis service registry."""
         try:
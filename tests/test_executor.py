@@ -0,0 +1,132 @@
+"""Tests for multi-step profile execution."""
+
+import pytest
+import asyncio
+import json
+
+from app.models.profile import ProcessingProfile
+from app.providers.base import LLMResponse
+from app.services.executor import ProfileExecutor
+
+
+class FakeProvider:
+    """Provider stub that records how many requests are in flight."""
+
+    def __init__(self, delay: float = 0.01, slow_prefixes=(), fail_prefixes=()):
+        self.name = "fake"
+        self.delay = delay
+        self.slow_prefixes = tuple(slow_prefixes)
+        self.fail_prefixes = tuple(fail_prefixes)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts = []
+        self.completed = []
+
+    async def generate_completion(self, prompt, config, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.prompts.append(prompt)
+        try:
+            await asyncio.sleep(5 if prompt.startswith(self.slow_prefixes) else self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if prompt.startswith(self.fail_prefixes):
+            raise RuntimeError("provider exploded")
+        self.completed.append(prompt)
+
+        return LLMResponse(
+            content=json.dumps({"ok": True}),
+            tokens_used=10,
+            provider="fake",
+            model="fake-model"
+        )
+
+
+class FakeSelector:
+    """Model selector stub that always returns the same provider."""
+
+    def __init__(self, provider: FakeProvider):
+        self.provider = provider
+
+    async def select_provider(self, config, global_overrides=None):
+        return self.provider
+
+    def invalidate_availability(self, provider):
+        pass
+
+
+def make_step(step_id: str, template: str, dependencies=None) -> dict:
+    """Build a minimal JSON step definition."""
+    return {
+        "step_id": step_id,
+        "name": step_id,
+        "prompt_template": template,
+        "dependencies": dependencies or [],
+        "max_retries": 0
+    }
+
+
+class TestProfileExecutor:
+    """Test profile execution ordering and concurrency."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create fake provider."""
+        return FakeProvider()
+
+    @pytest.fixture
+    def executor(self, provider):
+        """Create ProfileExecutor backed by the fake provider."""
+        return ProfileExecutor(FakeSelector(provider))
+
+    @pytest.fixture
+    def diamond_profile(self):
+        """Profile where two steps only depend on the first one."""
+        # "right" depends on "root" only through its prompt placeholder
+        return ProcessingProfile(
+            profile_id="diamond",
+            name="Diamond",
+            description="Fan-out / fan-in profile",
+            steps=[
+                make_step("root", "Root step: {transcript}"),
+                make_step("left", "Left step: {transcript} {root}", ["root"]),
+                make_step("right", "Right step: {transcript} {root}"),
+                make_step("merge", "Merge step: {transcript} {left} {right}", ["left", "right"]),
+            ]
+        )
+
+    def test_build_execution_waves(self, executor, diamond_profile):
+        """Placeholder references count as dependencies when grouping waves."""
+        waves = executor._build_execution_waves(diamond_profile)
+
+        assert [[step.step_id for step in wave] for wave in waves] == [
+            ["root"], ["right", "left"], ["merge"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self, executor, provider, diamond_profile):
+        """Steps in the same wave are executed concurrently."""
+        result = await executor.execute_profile(diamond_profile, "Hello world")
+
+        assert result.success is True
+        assert provider.max_in_flight == 2
+        assert [r.step_id for r in result.step_results] == ["root", "right", "left", "merge"]
+        assert result.total_tokens_used == 40
+        assert set(result.final_output) == {"root", "left", "right", "merge", "_metadata"}
+
+    @pytest.mark.asyncio
+    async def test_required_failure_cancels_rest_of_wave(self, diamond_profile):
+        """A failed required step stops its still-running siblings."""
+        provider = FakeProvider(slow_prefixes=("Right",), fail_prefixes=("Left",))
+        executor = ProfileExecutor(FakeSelector(provider))
+
+        result = await asyncio.wait_for(
+            executor.execute_profile(diamond_profile, "Hello world"), timeout=2
+        )
+
+        assert result.success is False
+        assert "Required step 'left' failed" in result.error
+        assert [r.step_id for r in result.step_results] == ["root", "left"]
+        assert provider.in_flight == 0
+        assert not any(p.startswith(("Right", "Merge")) for p in provider.completed)
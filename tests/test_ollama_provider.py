@@ -131,16 +131,15 @@ class TestOllamaProvider:
             mock_response.json.return_value = mock_models_response
             mock_get.return_value.__aenter__.return_value = mock_response
 
-            # Mock the list_available_models call
-            with patch.object(provider, 'list_available_models') as mock_list:
-                mock_list.return_value = ["llama3.1:8b", "mistral:7b"]
-                
-                health = await provider.check_health()
+            health = await provider.check_health()
 
-                assert health.available is True
-                assert health.response_time_ms is not None
-                assert health.response_time_ms > 0
-                assert len(health.models_available) == 2
+            # Models are read from the health check response itself
+            assert mock_get.call_count == 1
+            assert health.available is True
+            assert health.models_available == ["llama3.1:8b", "mistral:7b", "qwen2:1.5b"]
+            # The mocked request completes instantly, so this can be 0ms
+            assert health.response_time_ms is not None
+            assert health.response_time_ms >= 0
 
     @pytest.mark.asyncio
     async def test_check_health_unavailable(self, provider):
@@ -0,0 +1,111 @@
+"""Tests for profile loading and saving."""
+
+import pytest
+import json
+from unittest.mock import patch
+
+from app.models.profile import ProcessingProfile
+from app.services.profile_loader import ProfileManager, ProfileLoadError
+
+
+def make_profile(profile_id: str = "custom_profile", description: str = "Custom profile") -> ProcessingProfile:
+    """Build a minimal single-step profile."""
+    return ProcessingProfile(
+        profile_id=profile_id,
+        name="Custom",
+        description=description,
+        steps=[{
+            "step_id": "summarize",
+            "name": "Summarize",
+            "prompt_template": "Summarize this: {transcript}"
+        }],
+        metadata={"source": "imported", "updated_at": "2025-01-01T00:00:00+00:00"}
+    )
+
+
+class TestProfileManagerSave:
+    """Test saving profiles to disk."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create ProfileManager backed by a temporary directory."""
+        return ProfileManager(str(tmp_path))
+
+    def test_save_creates_file(self, manager, tmp_path):
+        """A new profile is written and cached."""
+        profile = make_profile()
+
+        assert manager.save_profile(profile) is True
+
+        data = json.loads((tmp_path / "custom_profile.json").read_text(encoding="utf-8"))
+        assert data["description"] == "Custom profile"
+        assert data["metadata"]["source"] == "user"
+        assert manager.load_profile("custom_profile") is profile
+
+    def test_duplicate_save_raises_and_keeps_original(self, manager, tmp_path):
+        """Saving over an existing file without overwrite is rejected."""
+        manager.save_profile(make_profile())
+        profile_file = tmp_path / "custom_profile.json"
+        original = profile_file.read_text(encoding="utf-8")
+
+        duplicate = make_profile(description="Replacement")
+        with pytest.raises(ProfileLoadError) as exc_info:
+            manager.save_profile(duplicate)
+
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__ is True
+        assert profile_file.read_text(encoding="utf-8") == original
+        # Metadata is only touched once the file is opened
+        assert duplicate.metadata.source == "imported"
+        assert duplicate.metadata.updated_at == "2025-01-01T00:00:00+00:00"
+
+    def test_failed_write_leaves_no_file(self, manager, tmp_path):
+        """A write failure removes the partially created file."""
+        profile = make_profile()
+
+        with patch.object(ProcessingProfile, "model_dump_json", side_effect=RuntimeError("boom")):
+            assert manager.save_profile(profile) is False
+
+        assert not (tmp_path / "custom_profile.json").exists()
+        # The failed attempt does not block a later save
+        assert manager.save_profile(profile) is True
+
+    def test_overwrite_replaces_file(self, manager, tmp_path):
+        """overwrite=True replaces an existing profile file."""
+        manager.save_profile(make_profile())
+
+        assert manager.save_profile(make_profile(description="Replacement"), overwrite=True) is True
+
+        data = json.loads((tmp_path / "custom_profile.json").read_text(encoding="utf-8"))
+        assert data["description"] == "Replacement"
+
+
+class TestProfileManagerIds:
+    """Test that listings only expose ids load_profile accepts."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create ProfileManager with a valid and an invalid profile file."""
+        manager = ProfileManager(str(tmp_path))
+        manager.save_profile(make_profile("custom_profile"))
+        (tmp_path / "My Notes.json").write_text(
+            make_profile("my_notes").model_dump_json(), encoding="utf-8"
+        )
+        # Drop the saved profile from cache so it is listed from disk
+        del manager._profile_cache["custom_profile"]
+        return manager
+
+    def test_listings_skip_invalid_file_names(self, manager):
+        """Files whose names are not valid ids are not listed."""
+        listed = [p["profile_id"] for p in manager.list_available_profiles()]
+
+        assert "My Notes" not in listed
+        assert "custom_profile" in listed
+        assert manager.list_profile_ids() == listed
+        assert manager.get_profile_details("My Notes") is None
+
+    @pytest.mark.parametrize("profile_id", [None, 123, ["business_meeting"], "../x", "My Notes", "ok\n"])
+    def test_load_rejects_invalid_ids(self, manager, profile_id):
+        """Malformed ids are treated as not found."""
+        assert manager.load_profile(profile_id) is None
+        assert manager.load_profile(profile_id, force_reload=True) is None
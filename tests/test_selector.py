@@ -0,0 +1,172 @@
+"""Tests for provider selection and status."""
+
+import pytest
+import asyncio
+import json
+
+from app.models.profile import ModelConfig, ProcessingProfile
+from app.providers import selector as selector_module
+from app.providers.base import LLMResponse, ProviderHealth
+from app.providers.selector import ModelSelector
+from app.services.executor import StepExecutor
+from app.services.interpolation import StepContext
+
+
+class StubProvider:
+    """Provider stub with switchable availability."""
+
+    def __init__(self, name: str, available: bool = True, delay: float = 0.0):
+        self.name = name
+        self.available = available
+        self.delay = delay
+        self.fail_completions = False
+        self.health_checks = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def check_health(self):
+        self.health_checks += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return ProviderHealth(available=self.available, models_available=[])
+
+    async def is_available(self):
+        health = await self.check_health()
+        return health.available
+
+    async def generate_completion(self, prompt, config, **kwargs):
+        if self.fail_completions:
+            raise RuntimeError(f"{self.name} is down")
+        return LLMResponse(
+            content=json.dumps({"ok": True}),
+            tokens_used=5,
+            provider=self.name,
+            model="stub-model"
+        )
+
+
+class CancelledProvider(StubProvider):
+    """Provider whose health check gets cancelled."""
+
+    async def check_health(self):
+        raise asyncio.CancelledError()
+
+
+class TestModelSelector:
+    """Test availability caching and fallback."""
+
+    @pytest.fixture
+    def local(self):
+        """Create local provider stub."""
+        return StubProvider("ollama")
+
+    @pytest.fixture
+    def remote(self):
+        """Create remote provider stub."""
+        return StubProvider("openrouter")
+
+    @pytest.fixture
+    def selector(self, local, remote):
+        """Create selector over both stubs."""
+        return ModelSelector({"local": local, "openrouter": remote})
+
+    @pytest.mark.asyncio
+    async def test_availability_reused_within_ttl(self, selector, local):
+        """Repeated selections reuse a recent availability check."""
+        for _ in range(3):
+            assert await selector.select_provider(ModelConfig()) is local
+
+        assert local.health_checks == 1
+
+    @pytest.mark.asyncio
+    async def test_availability_rechecked_after_ttl(self, selector, local, remote, monkeypatch):
+        """An expired availability result is checked again."""
+        assert await selector.select_provider(ModelConfig()) is local
+
+        local.available = False
+        monkeypatch.setattr(selector_module, "AVAILABILITY_TTL_SECONDS", 0.0)
+
+        assert await selector.select_provider(ModelConfig()) is remote
+        assert local.health_checks == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_recheck(self, selector, local, remote):
+        """A provider marked as failed is probed again on next selection."""
+        assert await selector.select_provider(ModelConfig()) is local
+
+        local.available = False
+        selector.invalidate_availability(local)
+
+        assert await selector.select_provider(ModelConfig()) is remote
+
+    @pytest.mark.asyncio
+    async def test_step_retry_falls_back_after_failure(self, selector, local, remote):
+        """A failed completion lets the retry fall back to another provider."""
+        assert await selector.select_provider(ModelConfig()) is local
+
+        # Local goes down while its availability is still cached
+        local.available = False
+        local.fail_completions = True
+
+        profile = ProcessingProfile(
+            profile_id="single",
+            name="Single",
+            description="One step",
+            steps=[{
+                "step_id": "only",
+                "name": "only",
+                "prompt_template": "Only step: {transcript}",
+                "max_retries": 1
+            }]
+        )
+        step = profile.steps[0]
+
+        result = await StepExecutor(selector).execute_step(step, StepContext("Hello world"))
+
+        assert result.success is True
+        assert result.provider_used == "openrouter"
+        assert result.retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_provider_status_checks_concurrently(self, local, remote):
+        """Health checks for all providers run at the same time."""
+        shared = {"in_flight": 0, "max": 0}
+
+        def track(provider):
+            original = provider.check_health
+
+            async def check_health():
+                shared["in_flight"] += 1
+                shared["max"] = max(shared["max"], shared["in_flight"])
+                try:
+                    return await original()
+                finally:
+                    shared["in_flight"] -= 1
+
+            provider.check_health = check_health
+
+        local.delay = remote.delay = 0.01
+        track(local)
+        track(remote)
+        remote.available = False
+
+        status = await ModelSelector({"local": local, "openrouter": remote}).get_provider_status()
+
+        assert shared["max"] == 2
+        assert status["local"]["available"] is True
+        assert status["openrouter"]["available"] is False
+
+    @pytest.mark.asyncio
+    async def test_provider_status_reports_cancelled_check(self, local):
+        """A cancelled health check is reported as unavailable."""
+        selector = ModelSelector({"local": local, "broken": CancelledProvider("broken")})
+
+        status = await selector.get_provider_status()
+
+        assert status["local"]["available"] is True
+        assert status["broken"]["available"] is False
+        assert status["broken"]["error"].startswith("Health check failed")